@@ -6,6 +6,7 @@ from aioretry import (
     RetryInfo
 )
 from binance.client import Client
+from binance.common.utils import enable_uvloop
 from binance.common.constants import (
     SubType,
     KlineInterval,
@@ -82,6 +82,9 @@ STREAM_HOST = 'wss://stream.binance.com'
 
 DEFAULT_STREAM_TIMEOUT = 5
 
+# The max number of incoming messages buffered by websockets
+STREAM_MAX_QUEUE = 2 ** 10
+
 # Close code used by binance.Stream
 # https://tools.ietf.org/html/rfc6455#section-7.4.2
 DEFAULT_STREAM_CLOSE_CODE = 4999
@@ -13,6 +13,26 @@ from .types import (
     WrappedEventCallback
 )
 
+try:
+    # orjson is much faster to decode stream messages
+    #   and to encode stream requests
+    from orjson import (
+        loads as json_parse,
+        dumps as _orjson_dumps
+    )
+
+    def json_stringify(obj) -> str:
+        # Binance stream requests should be sent as text frames,
+        #   so decode the bytes which orjson returns
+        return _orjson_dumps(obj).decode()
+
+except ModuleNotFoundError:  # pragma: no cover
+    # If orjson is not installed
+    from json import loads as json_parse  # noqa: F401
+
+    def json_stringify(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
 
 def make_list(subject: Any) -> list:
     return subject if isinstance(subject, list) else [subject]
@@ -22,10 +42,6 @@ def format_msg(string, *args) -> str:
     return MSG_PREFIX + string % args
 
 
-def json_stringify(obj) -> str:
-    return json.dumps(obj, separators=(',', ':'))
-
-
 def normalize_symbol(symbol: str, upper: bool = False) -> str:
     symbol = symbol.replace('_', '')
     return symbol.upper() if upper else symbol.lower()
@@ -84,3 +100,22 @@ def create_future() -> asyncio.Future:
     could not bind the Future with the current running event loop
     """
     return asyncio.get_running_loop().create_future()
+
+
+def enable_uvloop() -> bool:
+    """Installs the event loop policy of uvloop, which makes stream
+    connections receive messages much faster.
+
+    This function should be called before the event loop is created.
+
+    Returns:
+        bool: `True` if uvloop is installed and enabled
+    """
+
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
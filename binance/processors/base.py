@@ -3,6 +3,7 @@ import inspect
 from typing import (
     Optional,
     Set,
+    Tuple,
     Awaitable
 )
 
@@ -12,9 +13,7 @@ from binance.common.exceptions import (
 from binance.common.utils import normalize_symbol
 from binance.common.constants import (
     SubType,
-    ATOM,
-    KEY_PAYLOAD,
-    KEY_PAYLOAD_TYPE
+    ATOM
 )
 from binance.handlers.base import Handler
 
@@ -23,9 +22,17 @@ class Processor:
     # The handler class
     HANDLER: type
 
+    # All handler classes supported by the processor,
+    #   defaults to `(HANDLER,)`
+    HANDLER_TYPES: Tuple[type, ...] = ()
+
     # The payload['e'] of message
     PAYLOAD_TYPE = ATOM
 
+    # All payload['e'] supported by the processor,
+    #   defaults to `(PAYLOAD_TYPE,)`
+    PAYLOAD_TYPES: Tuple[str, ...] = ()
+
     # subtype used by client.subscribe
     SUB_TYPE: Optional[SubType] = None
 
@@ -34,9 +41,15 @@ class Processor:
 
         self._handlers = set()
 
+        if not self.HANDLER_TYPES:
+            self.HANDLER_TYPES = (self.HANDLER,)
+
         if self.PAYLOAD_TYPE == ATOM and self.SUB_TYPE is not None:
             self.PAYLOAD_TYPE = self.SUB_TYPE.value
 
+        if not self.PAYLOAD_TYPES:
+            self.PAYLOAD_TYPES = (self.PAYLOAD_TYPE,)
+
     def supports_subtype(
         self,
         t: SubType
@@ -72,16 +85,12 @@ class Processor:
         self,
         handler: Handler
     ) -> bool:
-        return isinstance(handler, self.HANDLER)
+        return isinstance(handler, self.HANDLER_TYPES)
 
     def is_message_type(self, msg):
-        payload = msg.get(KEY_PAYLOAD)
-
-        if payload is not None and \
-                type(payload) is dict and \
-                payload.get(KEY_PAYLOAD_TYPE) == self.PAYLOAD_TYPE:
-            return True, payload
-
+        # Messages with dict payloads are dispatched by `PAYLOAD_TYPES`,
+        #   so only processors of list payloads (all market streams)
+        #   need to override this method to match the stream name
         return False, None
 
     def add_handler(
@@ -5,7 +5,6 @@ from typing import (
 
 from binance.common.constants import (
     SubType,
-    KEY_PAYLOAD,
     KEY_PAYLOAD_TYPE
 )
 
@@ -39,7 +38,7 @@ class UserProcessor(Processor):
         'listStatus'
     )
 
-    HANDLERS = (
+    HANDLER_TYPES = (
         AccountInfoHandlerBase,
         AccountPositionHandlerBase,
         BalanceUpdateHandlerBase,
@@ -98,27 +97,11 @@ class UserProcessor(Processor):
         self._stop_keep_alive()
         await self._client.close_listen_key(self._listen_key)
 
-    def is_message_type(self, msg):
-        payload = msg.get(KEY_PAYLOAD)
-
-        if payload is not None and \
-                type(payload) is dict and \
-                payload.get(KEY_PAYLOAD_TYPE) in self.PAYLOAD_TYPES:
-            return True, payload
-
-        return False, None
-
-    def supports_handler(
-        self,
-        handler: Handler
-    ) -> bool:
-        return isinstance(handler, self.HANDLERS)
-
     def add_handler(
         self,
         handler: Handler
     ) -> None:
-        for i, HandlerBase in enumerate(self.HANDLERS):
+        for i, HandlerBase in enumerate(self.HANDLER_TYPES):
             if isinstance(handler, HandlerBase):
                 payload_type = self.PAYLOAD_TYPES[i]
 
@@ -1,11 +1,13 @@
 import asyncio
+import inspect
 import itertools
 from typing import (
     List,
     Iterable,
     Set,
     Dict,
-    Tuple
+    Tuple,
+    Optional
 )
 
 from binance.processors import (
@@ -16,17 +18,16 @@ from binance.processors import (
 from binance.processors.base import Processor
 
 from binance.common.constants import (
-    SubType
+    SubType,
+    KEY_PAYLOAD,
+    KEY_PAYLOAD_TYPE
 )
 from binance.common.exceptions import (
     InvalidSubParamsException,
     UnsupportedSubTypeException
 )
 
-from binance.common.utils import (
-    make_list,
-    wrap_coroutine
-)
+from binance.common.utils import make_list
 
 
 class HandlerContext:
@@ -38,28 +39,67 @@ class HandlerContext:
     # processors that current used
     _processors: Set[Processor]
 
-    # The map of payload_type -> processor
-    _processor_cache: Dict[SubType, Processor]
+    # The cache of handler class -> processor
+    _handler_table: Dict[type, Processor]
+
+    # The map of subtype -> processor
+    _subtype_table: Dict[SubType, Processor]
+
+    # The map of payload_type -> processor that current used
+    _payload_table: Dict[str, Processor]
 
     def __init__(self, client) -> None:
-        self._handler_table = {}
         self._all_processors = [Factory(client) for Factory in self.PROCESSORS]
         self._processors = set()
-        self._processor_cache = {}
         self._exception_processor = ExceptionProcessor(client)
 
+        self._handler_table = {}
+        self._subtype_table = {}
+        self._payload_table = {}
+
+        for subtype in SubType:
+            for processor in self._all_processors:
+                # The former processor takes precedence
+                if processor.supports_subtype(subtype):
+                    self._subtype_table[subtype] = processor
+                    break
+
     def set_handler(self, handler) -> bool:
         if self._exception_processor.supports_handler(handler):
             self._exception_processor.add_handler(handler)
             return True
 
+        processor = self._get_handler_processor(handler)
+
+        if processor is None:
+            return False
+
+        self._processors.add(processor)
+        processor.add_handler(handler)
+
+        for payload_type in processor.PAYLOAD_TYPES:
+            self._payload_table[payload_type] = processor
+
+        return True
+
+    def _get_handler_processor(
+        self,
+        handler
+    ) -> Optional[Processor]:
+        Handler = type(handler)
+
+        processor = self._handler_table.get(Handler)
+        if processor is not None:
+            return processor
+
+        # The first supporting processor in `PROCESSORS` takes precedence,
+        #   if the handler inherits more than one handler base classes
         for processor in self._all_processors:
             if processor.supports_handler(handler):
-                self._processors.add(processor)
-                processor.add_handler(handler)
-                return True
+                self._handler_table[Handler] = processor
+                return processor
 
-        return False
+        return None
 
     # client.subscribe(subtype_needs_no_param_or_has_default_param)
     # -> client.subscribe(SubType.ALL_MARKET_MINI_TICKERS)
@@ -78,46 +118,44 @@ class HandlerContext:
     #       (SubType.TICKER, 'BNBUSDT)
     # )
     def overload_subscriptions(self, *args) -> List[tuple]:
+        # Fast path for the most common usage
+        # -> client.subscribe(SubType.TICKER, 'BTCUSDT')
+        if len(args) == 2 and \
+                type(args[1]) is str and \
+                isinstance(args[0], SubType):
+            return [args]
+
         # Subs is a Tuple[tuple]
         subs = args if type(args[0]) is tuple else (args,)
         params = []
 
         for subtype_param in subs:
             length = len(subtype_param)
-            prefix = None
 
             # subtype without params
             # ('allMarketMiniTickers',)
-            if length == 1:
-                args_iter = itertools.product(
-                    make_list(subtype_param[0])
-                )
             # ('trade', 'BNBUSDT')
             # (['trade'], ['BNBUSDT'])
-            elif length == 2:
-                args_iter = itertools.product(
-                    make_list(subtype_param[0]),
-                    make_list(subtype_param[1])
-                )
+            if length == 1 or length == 2:
+                prefix = ()
+                lists = subtype_param
 
             # Only kline has three args for now
             elif length == 3 and subtype_param[0] == SubType.KLINE:
-                prefix = SubType.KLINE
-                args_iter = itertools.product(
-                    make_list(subtype_param[1]),
-                    make_list(subtype_param[2])
-                )
+                prefix = (SubType.KLINE,)
+                lists = subtype_param[1:]
 
             else:
                 raise InvalidSubParamsException('please check the document')
 
-            for partial_args in args_iter:
-                if prefix is None:
-                    params.append(partial_args)
-                else:
-                    params.append(
-                        (prefix, *partial_args)
-                    )
+            # Most usually, none of the params is a list,
+            #   so that we need not to make the product of them
+            if not any(isinstance(arg, list) for arg in lists):
+                params.append(subtype_param)
+                continue
+
+            for partial_args in itertools.product(*map(make_list, lists)):
+                params.append((*prefix, *partial_args))
 
         return params
 
@@ -126,11 +164,18 @@ class HandlerContext:
         subscribe: bool,
         subscriptions: Iterable[tuple]
     ) -> Tuple[str]:
+        subscribe_param = self._subscribe_param
+
         tasks = [
-            self._subscribe_param(subscribe, *params)
+            subscribe_param(subscribe, *params)
             for params in subscriptions
         ]
 
+        # Await the only coroutine directly,
+        #   so that `asyncio.gather` need not to wrap it in a task
+        if len(tasks) == 1:
+            return [await tasks[0]]
+
         return await asyncio.gather(*tasks)
 
     async def _subscribe_param(
@@ -139,34 +184,51 @@ class HandlerContext:
         *args
     ) -> str:
         processor = self._get_processor(args[0])
-        return await wrap_coroutine(
-            processor.subscribe_param(subscribe, *args)
-        )
+        ret = processor.subscribe_param(subscribe, *args)
+
+        # Only `UserProcessor.subscribe_param` is async,
+        #   so we avoid creating another coroutine by `wrap_coroutine`
+        if inspect.iscoroutine(ret):
+            return await ret
+
+        return ret
 
     def _get_processor(
         self,
         subtype: SubType
     ) -> Processor:
-        processor = self._processor_cache.get(subtype)
-        if processor:
-            return processor
+        try:
+            return self._subtype_table[subtype]
+        except (KeyError, TypeError):
+            # TypeError: unhashable subtype
+            raise UnsupportedSubTypeException(subtype)
+
+    async def receive(self, msg) -> None:
+        # The dispatching of dict payloads is inlined,
+        #   so that most messages cost no extra coroutine
+        try:
+            payload = msg.get(KEY_PAYLOAD)
+
+            if type(payload) is dict:
+                processor = self._payload_table.get(
+                    payload.get(KEY_PAYLOAD_TYPE)
+                )
+
+                if processor is not None:
+                    await processor.dispatch(payload)
+
+                return
 
-        for p in self._all_processors:
-            if p.supports_subtype(subtype):
-                self._processor_cache[subtype] = p
-                return p
+            await self._receive_by_stream(msg)
 
-        raise UnsupportedSubTypeException(subtype)
+        except Exception as e:
+            await self._exception_processor.dispatch(e)
 
-    async def _receive(self, msg) -> None:
+    async def _receive_by_stream(self, msg) -> None:
+        # Payloads of all market streams are lists,
+        #   which could only be distinguished by the stream name
         for processor in self._processors:
             is_payload, payload = processor.is_message_type(msg)
 
             if is_payload:
                 await processor.dispatch(payload)
-
-    async def receive(self, msg) -> None:
-        try:
-            await self._receive(msg)
-        except Exception as e:
-            await self._exception_processor.dispatch(e)
@@ -1,4 +1,3 @@
-import json
 import logging
 import asyncio
 from asyncio import Future
@@ -26,10 +25,10 @@ from aioretry import (
 
 from binance.common.utils import (
     json_stringify,
+    json_parse,
     format_msg,
     repr_exception,
-    wrap_event_callback,
-    create_future
+    wrap_event_callback
 )
 
 from binance.common.exceptions import (
@@ -45,7 +44,8 @@ from binance.common.constants import (
     STREAM_KEY_RESULT,
     STREAM_KEY_ERROR,
     ERROR_KEY_CODE,
-    ERROR_KEY_MESSAGE
+    ERROR_KEY_MESSAGE,
+    STREAM_MAX_QUEUE
 )
 
 from binance.common.types import (
@@ -71,6 +71,7 @@ class Stream:
         timeout (float): timeout in seconds to receive the next websocket message
     """
 
+    _loop: Optional[asyncio.AbstractEventLoop]
     _socket: Optional[WebSocketClientProtocol]
     _message_futures: Dict[int, Future]
     _retry_policy: RetryPolicy
@@ -98,10 +99,15 @@ class Stream:
         self._retry_policy = retry_policy
         self._timeout = timeout
 
+        self._loop = None
         self._socket = None
         self._conn_task = None
         self._connected_task = None
 
+        self._idle_handle = None
+        self._ping_task = None
+        self._last_received = 0
+
         # message_id
         self._message_id = 0
         self._message_futures = {}
@@ -119,9 +125,11 @@ class Stream:
         self._socket = socket
 
     def connect(self):
+        self._loop = asyncio.get_running_loop()
         self._before_connect()
 
         self._conn_task = asyncio.create_task(self._connect())
+
         return self
 
     async def _emit(
@@ -139,16 +147,21 @@ class Stream:
     async def _handle_message(self, msg) -> None:
         # > The id used in the JSON payloads is an unsigned INT used as
         # > an identifier to uniquely identify the messages going back and forth
-        if (
-            STREAM_KEY_ID not in msg
-        ) or (
-            msg[STREAM_KEY_ID] not in self._message_futures
-        ):
+        message_id = msg.get(STREAM_KEY_ID)
+        future = None
+
+        # Stream data messages have no id,
+        #   so we need not to look up `self._message_futures`
+        if message_id is not None:
+            future = self._message_futures.pop(message_id, None)
+
+        if future is None:
             await self._emit(ON_MESSAGE, msg)
             return
 
-        message_id = msg[STREAM_KEY_ID]
-        future = self._message_futures[message_id]
+        if future.done():
+            # The caller of `self.send()` is cancelled
+            return
 
         if STREAM_KEY_RESULT in msg:
             future.set_result(msg[STREAM_KEY_RESULT])
@@ -163,18 +176,15 @@ class Stream:
                 )
             )
 
-        del self._message_futures[message_id]
-
     def _before_connect(self) -> None:
-        self._open_future = create_future()
+        # Keep the pending future if the last connection attempt failed,
+        #   so that requests waiting for it will still be sent
+        #   once the stream is connected
+        if self._open_future is None:
+            self._open_future = self._loop.create_future()
 
     async def _receive(self) -> None:
-        try:
-            msg = await asyncio.wait_for(
-                self._socket.recv(), timeout=self._timeout)
-        except asyncio.TimeoutError:
-            await self._socket.ping()
-            return
+        msg = await self._socket.recv()
 
         # Other exceptions for socket.recv():
         # - ConnectionClosed
@@ -182,34 +192,87 @@ class Stream:
         # - ConnectionClosedError
         # which should be handled by self._connect()
 
-        else:
-            try:
-                parsed = json.loads(msg)
-            except ValueError as e:
-                logger.error(
-                    format_msg(
-                        'stream message "%s" is an invalid JSON: reason: %s',
-                        msg,
-                        e
-                    )
+        # Only record the time, and let `self._check_idle` ping,
+        #   which is much cheaper than `asyncio.wait_for` for every message
+        self._last_received = self._loop.time()
+
+        try:
+            parsed = json_parse(msg)
+        except ValueError as e:
+            logger.error(
+                format_msg(
+                    'stream message "%s" is an invalid JSON: reason: %s',
+                    msg,
+                    e
                 )
+            )
 
-                return
-            else:
-                await self._handle_message(parsed)
+            return
+        else:
+            await self._handle_message(parsed)
+
+    def _start_idle_check(self, socket) -> None:
+        self._last_received = self._loop.time()
+        self._idle_handle = self._loop.call_later(
+            self._timeout, self._check_idle, socket
+        )
+
+    def _stop_idle_check(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+        if self._ping_task is not None:
+            self._ping_task.cancel()
+            self._ping_task = None
+
+    def _check_idle(self, socket) -> None:
+        now = self._loop.time()
+        idle = now - self._last_received
+
+        if idle < self._timeout:
+            # A message is received after the check was scheduled
+            self._idle_handle = self._loop.call_later(
+                self._timeout - idle, self._check_idle, socket
+            )
+            return
+
+        # No message within `self._timeout`, ping to keep alive
+        self._ping_task = asyncio.create_task(self._ping(socket))
+
+        self._last_received = now
+        self._idle_handle = self._loop.call_later(
+            self._timeout, self._check_idle, socket
+        )
+
+    async def _ping(self, socket) -> None:
+        try:
+            await socket.ping()
+        except ConnectionClosed:
+            # Which should be handled by self._connect()
+            pass
 
     @retry(
         retry_policy='_retry_policy',
         before_retry='_reconnect'
     )
     async def _connect(self) -> None:
-        async with connect(self._uri) as socket:
+        async with connect(
+            self._uri,
+            # Binance stream does not require permessage-deflate,
+            #   which costs an inflate for every incoming message
+            compression=None,
+            # Buffer more incoming messages during bursts
+            max_queue=STREAM_MAX_QUEUE
+        ) as socket:
             self._set_socket(socket)
 
             self._connected_task = asyncio.create_task(
                 self._emit(ON_CONNECTED)
             )
 
+            self._start_idle_check(socket)
+
             try:
                 # Do not receive messages if the stream is closing
                 while not self._closing:
@@ -230,6 +293,9 @@ class Stream:
                 # Raise, so aioretry will reconnecting
                 raise e
 
+            finally:
+                self._stop_idle_check()
+
     async def _reconnect(self, info: RetryInfo) -> None:
         logger.error(
             format_msg(
@@ -283,12 +349,17 @@ class Stream:
 
         self._conn_task.cancel()
 
+        self._abandon_requests()
+
         # Make sure:
         # - conn_task is cancelled
         # - socket is closed
         for coro in asyncio.as_completed(tasks):
             try:
                 await coro
+            except asyncio.CancelledError:
+                # conn_task is cancelled while it is waiting to reconnect
+                pass
             except Exception as e:
                 logger.error(
                     format_msg('close tasks error: %s', e)
@@ -333,13 +404,43 @@ class Stream:
             else:
                 raise StreamDisconnectedException(self._uri)
 
-        future = create_future()
+        future = self._loop.create_future()
 
         message_id = self._message_id
         self._message_id += 1
 
         msg[STREAM_KEY_ID] = message_id
+        data = json_stringify(msg)
+
         self._message_futures[message_id] = future
 
-        await socket.send(json_stringify(msg))
+        try:
+            await socket.send(data)
+        except BaseException:
+            del self._message_futures[message_id]
+            raise
+
         return await future
+
+    def _abandon_requests(self) -> None:
+        """Fails all requests which are waiting for the connection
+        or for their responses, which will never come after closing
+        """
+
+        exception = StreamDisconnectedException(self._uri)
+
+        open_future = self._open_future
+
+        if open_future is not None and not open_future.done():
+            open_future.set_exception(exception)
+            # Mark the exception as retrieved,
+            #   in case that no request is waiting for the connection
+            open_future.exception()
+
+        self._open_future = None
+
+        for future in self._message_futures.values():
+            if not future.done():
+                future.set_exception(exception)
+
+        self._message_futures.clear()
@@ -36,7 +36,9 @@ settings = dict(
     install_requires=read_requirements('requirements.txt'),
     tests_require=read_requirements('test-requirements.txt'),
     extras_require={
-        'pandas': ['pandas']
+        'pandas': ['pandas'],
+        'orjson': ['orjson'],
+        'uvloop': ['uvloop']
     },
     license='MIT',
     keywords='binance exchange sdk rest api bitcoin btc bnb ethereum eth neo',
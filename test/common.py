@@ -1,8 +1,8 @@
 import asyncio
 
-from aiohttp import web
+from aiohttp import web, WSMsgType
 
-from binance.common.utils import json_stringify
+from binance.common.utils import json_stringify, json_parse
 
 MAX_PRINT = 150
 
@@ -34,6 +34,10 @@ class SocketServer:
 
         self._delay = 0.2
         self._valid_json = True
+        self._silent = False
+
+        # The number of pings received from clients
+        self.pings = 0
 
     def start(self):
         self._started = True
@@ -47,6 +51,10 @@ class SocketServer:
         self._valid_json = False
         return self
 
+    def silent(self, silent=True):
+        self._silent = silent
+        return self
+
     def stop(self):
         self._started = False
         return self
@@ -65,17 +73,56 @@ class SocketServer:
             await ws.close(code=1006)
             return
 
+        sending = asyncio.create_task(self._send(ws))
+
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.PING:
+                    self.pings += 1
+                    await ws.pong(msg.data)
+
+                elif msg.type == WSMsgType.TEXT:
+                    await ws.send_str(self._respond(json_parse(msg.data)))
+        finally:
+            sending.cancel()
+
+    def _respond(self, request) -> str:
+        params = request.get('params')
+
+        # Like Binance, the whole request fails if any param is invalid
+        if type(params) is not list or 'invalid' in params:
+            return json_stringify({
+                'error': {
+                    'code': 2,
+                    'msg': 'Invalid request'
+                },
+                'id': request['id']
+            })
+
+        # Respond the params, so that we could check the response
+        return json_stringify({
+            'result': params,
+            'id': request['id']
+        })
+
+    async def _send(self, ws) -> None:
         while self._started:
             if self._delay:
                 await asyncio.sleep(self._delay)
 
+            if self._silent:
+                continue
+
             if self._valid_json:
                 await ws.send_str('{"ok":true}')
             else:
                 await ws.send_str('{"ok":true')
 
+        await ws.close()
+
     async def _handler(self, request):
-        ws = web.WebSocketResponse()
+        # Handle pings by ourselves to count them
+        ws = web.WebSocketResponse(autoping=False)
         await ws.prepare(request)
 
         await self._handle(ws)
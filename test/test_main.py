@@ -1,4 +1,6 @@
-from binance import Client
+import sys
+
+from binance import Client, enable_uvloop
 
 
 def test_init_client():
@@ -14,3 +16,9 @@ def test_init_client_key():
 def test_no_api_key():
     """create a client with no args"""
     Client()
+
+
+def test_enable_uvloop_not_installed(monkeypatch):
+    """enable_uvloop does nothing if uvloop is not installed"""
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    assert enable_uvloop() is False
@@ -94,20 +94,24 @@ FREE_CASES = [
 
 
 @pytest.mark.asyncio
-async def test_free_apis():
+@pytest.mark.parametrize(
+    'case',
+    FREE_CASES,
+    ids=lambda case: case['name']
+)
+async def test_free_apis(case):
     client = Client()
 
     print('')
 
     async def go():
-        for case in FREE_CASES:
-            name = case['name']
-            args = case.get('a', tuple())
-            kwargs = case.get('ka', {})
+        name = case['name']
+        args = case.get('a', tuple())
+        kwargs = case.get('ka', {})
 
-            ret = await getattr(client, name)(*args, **kwargs)
+        ret = await getattr(client, name)(*args, **kwargs)
 
-            print_json(name + ':', ret)
+        print_json(name + ':', ret)
 
     await go()
 
@@ -109,3 +109,143 @@ async def test_json_error():
 
     await stream.close()
     await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ping_when_idle():
+    server = SocketServer().silent()
+    await server.start().run()
+
+    stream = Stream(
+        f'ws://localhost:{PORT}/stream',
+        lambda msg: None,
+        timeout=0.1
+    ).connect()
+
+    await asyncio.sleep(0.5)
+
+    # The stream pings every 0.1s, and the idle check re-arms
+    assert server.pings >= 2
+
+    # The server sends a message every 0.05s
+    server.silent(False).no_timeout()
+    await asyncio.sleep(0.3)
+
+    pings = server.pings
+    await asyncio.sleep(0.5)
+
+    # No ping if messages keep arriving within the timeout
+    assert server.pings == pings
+
+    await stream.close()
+    await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_send_requests():
+    server = SocketServer().silent()
+    await server.start().run()
+
+    stream = Stream(
+        f'ws://localhost:{PORT}/stream',
+        lambda msg: None
+    ).connect()
+
+    def subscribe(params):
+        return stream.send({
+            'method': 'SUBSCRIBE',
+            'params': params
+        })
+
+    # Requests sent at the same time are not merged,
+    #   so an invalid one will not fail others
+    results = await asyncio.gather(
+        subscribe(['btcusdt@ticker']),
+        subscribe(['invalid']),
+        subscribe(['bnbusdt@ticker', 'bnbbtc@ticker']),
+        return_exceptions=True
+    )
+
+    assert results[0] == ['btcusdt@ticker']
+    assert isinstance(results[1], StreamSubscribeException)
+    assert results[2] == ['bnbusdt@ticker', 'bnbbtc@ticker']
+
+    # Params which are not lists are sent as they are
+    with pytest.raises(StreamSubscribeException, match='Invalid request'):
+        await subscribe(None)
+
+    with pytest.raises(StreamSubscribeException, match='Invalid request'):
+        await subscribe('btcusdt@ticker')
+
+    # A request fails to be written
+    with pytest.raises(TypeError):
+        await subscribe({'btcusdt@ticker'})
+
+    # The stream still works after failures
+    assert await subscribe(['btcusdt@trade']) == ['btcusdt@trade']
+
+    await stream.close()
+    await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_send_after_reconnect():
+    # Nothing listens on the port, so the first attempts fail
+    stream = Stream(
+        f'ws://localhost:{PORT}/stream',
+        lambda msg: None,
+        retry_policy=lambda info: (False, 0.1)
+    ).connect()
+
+    def subscribe(params):
+        return stream.send({
+            'method': 'SUBSCRIBE',
+            'params': params
+        })
+
+    # Sent before the stream is connected
+    pending = asyncio.create_task(subscribe(['btcusdt@ticker']))
+
+    await asyncio.sleep(0.3)
+
+    server = SocketServer().silent()
+    await server.start().run()
+
+    assert await asyncio.wait_for(
+        subscribe(['bnbusdt@ticker']), 1
+    ) == ['bnbusdt@ticker']
+
+    assert await asyncio.wait_for(pending, 1) == ['btcusdt@ticker']
+
+    await stream.close()
+    await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_close_with_pending_requests():
+    # Nothing listens on the port, so the stream keeps reconnecting
+    stream = Stream(
+        f'ws://localhost:{PORT}/stream',
+        lambda msg: None,
+        retry_policy=lambda info: (False, 0.1)
+    ).connect()
+
+    tasks = [
+        asyncio.create_task(stream.send({
+            'method': 'SUBSCRIBE',
+            'params': [f'{symbol}@ticker']
+        }))
+        for symbol in ['btcusdt', 'bnbusdt', 'bnbbtc']
+    ]
+
+    await asyncio.sleep(0.2)
+    await stream.close()
+
+    for task in tasks:
+        with pytest.raises(StreamDisconnectedException):
+            await task
+
+    with pytest.raises(StreamDisconnectedException):
+        await stream.send({
+            'method': 'LIST_SUBSCRIPTIONS'
+        })
@@ -9,6 +9,7 @@ from binance import (
     KlineInterval,
 
     TickerHandlerBase,
+    TradeHandlerBase,
     KlineHandlerBase,
 
     InvalidHandlerException,
@@ -76,6 +77,73 @@ async def test_handler_exception_handler(client):
     await client.close()
 
 
+class FakeStream:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+    async def close(self, code):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_subscribe_in_one_message(client):
+    stream = FakeStream()
+    client._data_stream = stream
+
+    await client.subscribe(
+        [SubType.TICKER, SubType.TRADE],
+        ['BTCUSDT', 'BNB_USDT']
+    )
+
+    assert stream.sent == [{
+        'method': 'SUBSCRIBE',
+        'params': [
+            'btcusdt@ticker',
+            'bnbusdt@ticker',
+            'btcusdt@trade',
+            'bnbusdt@trade'
+        ]
+    }]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_single(client):
+    stream = FakeStream()
+    client._data_stream = stream
+
+    await client.subscribe(SubType.TICKER, 'BNB_USDT')
+
+    assert stream.sent == [{
+        'method': 'SUBSCRIBE',
+        'params': ['bnbusdt@ticker']
+    }]
+    assert client._subscribed == {(SubType.TICKER, 'BNB_USDT')}
+
+    await client.close()
+
+
+def test_handler_processor_precedence(client):
+    # TradeProcessor precedes TickerProcessor in `PROCESSORS`
+    class TickerTradeHandler(TickerHandlerBase, TradeHandlerBase):
+        pass
+
+    ctx = client._get_handler_ctx()
+
+    assert client.handler(TickerTradeHandler()) is client
+    processor = ctx._handler_table[TickerTradeHandler]
+    assert processor.SUB_TYPE == SubType.TRADE
+
+    # The processor of the handler class is cached
+    client.handler(TickerTradeHandler())
+    assert ctx._handler_table[TickerTradeHandler] is processor
+    assert len(processor._handlers) == 2
+
+
 def test_invalid_handler(client):
     with pytest.raises(InvalidHandlerException, match='invalid handler'):
         client.handler(1)
@@ -98,6 +166,9 @@ async def test_invalid_subtype_symbol(client):
     with pytest.raises(UnsupportedSubTypeException, match='subtype "unknown"'):
         await client.subscribe('unknown')
 
+    with pytest.raises(UnsupportedSubTypeException, match='not supported'):
+        await client.subscribe({})
+
     with pytest.raises(InvalidSubTypeParamException, match='symbol'):
         await client.subscribe(SubType.KLINE)
 